@@ -1,9 +1,10 @@
+import functools
 import os
-from typing import Type, Dict, TypeVar
+from typing import Type, Dict, TypeVar, Tuple
 
 from fromenv.errors import MissingRequiredVar, AmbiguousVarError
 from fromenv.internal.helpers.data_classes import DataClasses
-from fromenv.internal.loaders import Config, Strategy, VarBinding
+from fromenv.internal.loaders import Config, Strategy, VarBinding, Value, Loader
 
 # Specify exported symbols
 __all__ = (
@@ -21,10 +22,19 @@ def from_env(data_class: Type[T], env: Dict[str, str] | None = None, config: Con
     if not DataClasses.is_dataclass(data_class):
         raise ValueError(f"Not a data class: {data_class}")
 
-    env = env or os.environ
+    if env is None:
+        env = dict(os.environ)
 
-    config = config or Config()
+    strategy, root_value, loader = _plan(data_class, config or Config())
+    return loader.load(VarBinding(env), root_value, strategy)
+
+
+# The plans hold strong references, so the cache keeps the most recently
+# loaded data classes (along with their strategies) alive.
+@functools.lru_cache(maxsize=256)
+def _plan(data_class: Type, config: Config) -> Tuple[Strategy, Value, Loader]:
+    """Prepare (and cache) everything needed to load the data class with the given config."""
     strategy = Strategy(config)
     root_value = strategy.root_value(data_class)
     loader = strategy.resolve_loader(root_value)
-    return loader.load(VarBinding(env), root_value, strategy)
+    return strategy, root_value, loader
@@ -10,11 +10,16 @@ class MissingRequiredVar(LoadingError):
 
     var_name: str
     qual_value: str
+    message: str | None
 
     def __init__(self, var_name: str, qual_name: str, message: str | None = None):
-        super().__init__(message or f"Variable '{var_name}' not found (required for {qual_name})")
+        super().__init__(var_name, qual_name, message)
         self.var_name = var_name
         self.qual_value = qual_name
+        self.message = message
+
+    def __str__(self) -> str:
+        return self.message or f"Variable '{self.var_name}' not found (required for {self.qual_value})"
 
 
 class AmbiguousVarError(LoadingError):
@@ -23,14 +28,20 @@ class AmbiguousVarError(LoadingError):
     var_name: str
     first_qual_name: str
     second_qual_name: str
+    message: str | None
 
     def __init__(self, var_name: str, first_qual_name: str, second_qual_name: str, message: str | None = None):
-        super().__init__(
-            message or f"Variable '{var_name}' has ambiguous binding:\n\t1. {first_qual_name}\n\t2. {second_qual_name}"
-        )
+        super().__init__(var_name, first_qual_name, second_qual_name, message)
         self.var_name = var_name
         self.first_qual_name = first_qual_name
         self.second_qual_name = second_qual_name
+        self.message = message
+
+    def __str__(self) -> str:
+        return self.message or (
+            f"Variable '{self.var_name}' has ambiguous binding:"
+            f"\n\t1. {self.first_qual_name}\n\t2. {self.second_qual_name}"
+        )
 
 
 class UnsupportedValueType(LoadingError):
@@ -38,11 +49,16 @@ class UnsupportedValueType(LoadingError):
 
     qual_name: str
     value_type: Type
+    message: str | None
 
     def __init__(self, qual_name: str, value_type: Type, message: str | None = None):
-        super().__init__(message or f"{qual_name} has unsupported type: {value_type}")
+        super().__init__(qual_name, value_type, message)
         self.qual_name = qual_name
         self.value_type = value_type
+        self.message = message
+
+    def __str__(self) -> str:
+        return self.message or f"{self.qual_name} has unsupported type: {self.value_type}"
 
 
 class UnionLoadingError(LoadingError):
@@ -50,11 +66,16 @@ class UnionLoadingError(LoadingError):
 
     qual_name: str
     value_type: Type
+    message: str | None
 
     def __init__(self, qual_name: str, value_type: Type, message: str | None = None):
-        super().__init__(message or f"None of the union type alternatives could be loaded for {qual_name}")
+        super().__init__(qual_name, value_type, message)
         self.qual_name = qual_name
         self.value_type = value_type
+        self.message = message
+
+    def __str__(self) -> str:
+        return self.message or f"None of the union type alternatives could be loaded for {self.qual_name}"
 
 
 class InvalidVariableFormat(LoadingError, TypeError):
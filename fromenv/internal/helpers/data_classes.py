@@ -1,8 +1,23 @@
 """Collection of utils to work with dataclasses."""
 
 import dataclasses
-import inspect
-from typing import Type, Iterable
+import typing
+from typing import Type, NamedTuple, Tuple, Dict, Callable, Any
+from weakref import WeakKeyDictionary
+
+_MISSING = dataclasses.MISSING
+
+
+class _ClassInfo(NamedTuple):
+    """Precomputed data class introspection results."""
+
+    fields: Tuple[dataclasses.Field, ...]
+    required: Tuple[dataclasses.Field, ...]
+    defaults: Dict[str, Callable[[], Any]]
+    types: Dict[str, Type]
+
+
+_CLASS_CACHE: "WeakKeyDictionary[Type, _ClassInfo]" = WeakKeyDictionary()
 
 
 class DataClasses:
@@ -12,23 +27,61 @@ class DataClasses:
     @staticmethod
     def is_dataclass(data_class: Type) -> bool:
         """Check if the argument is a data class object."""
-        return inspect.isclass(data_class) and dataclasses.is_dataclass(data_class)
+        return isinstance(data_class, type) and hasattr(data_class, "__dataclass_fields__")
+
+    @staticmethod
+    def info(data_class: Type) -> _ClassInfo:
+        """Get cached introspection results for the data class."""
+        info = _CLASS_CACHE.get(data_class)
+        if info is None:
+            info = DataClasses._inspect(data_class)
+            _CLASS_CACHE[data_class] = info
+        return info
+
+    @staticmethod
+    def _inspect(data_class: Type) -> _ClassInfo:
+        """Inspect data class fields."""
+        fields = dataclasses.fields(data_class)
+        required = tuple(field for field in fields if not DataClasses.has_default(field))
+        defaults: Dict[str, Callable[[], Any]] = {}
+        for field in fields:
+            if field.default is not _MISSING:
+                defaults[field.name] = lambda default=field.default: default
+            elif field.default_factory is not _MISSING:
+                defaults[field.name] = field.default_factory
+        types = DataClasses._field_types(data_class, fields)
+        return _ClassInfo(fields=fields, required=required, defaults=defaults, types=types)
+
+    @staticmethod
+    def _field_types(data_class: Type, fields: Tuple[dataclasses.Field, ...]) -> Dict[str, Type]:
+        """Get field types with string annotations resolved (if possible)."""
+        types: Dict[str, Type] = {field.name: field.type for field in fields}
+        if not any(isinstance(field_type, str) for field_type in types.values()):
+            return types
+        try:
+            type_hints = typing.get_type_hints(data_class, include_extras=True)
+        except Exception:  # Unresolvable annotations
+            # Leave the annotations as is, so loading them fails with UnsupportedValueType
+            return types
+        for name, field_type in types.items():
+            if isinstance(field_type, str):
+                types[name] = type_hints[name]
+        return types
 
     @staticmethod
     def has_default(field: dataclasses.Field) -> bool:
         """Check if the field has a default value."""
-        return not (field.default is dataclasses.MISSING and field.default_factory is dataclasses.MISSING)
+        return not (field.default is _MISSING and field.default_factory is _MISSING)
 
     @staticmethod
-    def required_fields(data_class: Type) -> Iterable[dataclasses.Field]:
-        """Iterate over required fields."""
-        return (field for field in dataclasses.fields(data_class) if not DataClasses.has_default(field))
+    def required_fields(data_class: Type) -> Tuple[dataclasses.Field, ...]:
+        """Get required fields."""
+        return DataClasses.info(data_class).required
 
     @staticmethod
-    def default_value(field: dataclasses.Field):
+    def default_value(data_class: Type, field: dataclasses.Field):
         """Get default value."""
-        if field.default is not dataclasses.MISSING:
-            return field.default
-        if field.default_factory is not dataclasses.MISSING:
-            return field.default_factory()
-        raise ValueError(f"Field {field} doesn't have default value.")
+        provider = DataClasses.info(data_class).defaults.get(field.name)
+        if provider is None:
+            raise ValueError(f"Field {field} doesn't have default value.")
+        return provider()
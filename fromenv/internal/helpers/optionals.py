@@ -1,6 +1,9 @@
+import functools
 import types
 import typing
-from typing import Type
+from typing import Type, Tuple, get_origin as _get_origin, get_args as _get_args
+
+_NONE_TYPE = types.NoneType
 
 
 class OptionalTypes:
@@ -9,17 +12,39 @@ class OptionalTypes:
     @staticmethod
     def is_optional(value_type: Type) -> bool:
         """Check if type is optional."""
-        origin = typing.get_origin(value_type)
+        try:
+            return OptionalTypes._is_optional_cached(value_type)
+        except TypeError:  # Unhashable type
+            return OptionalTypes._is_optional(value_type)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _is_optional_cached(value_type: Type) -> bool:
+        """Check if type is optional (cached)."""
+        return OptionalTypes._is_optional(value_type)
+
+    @staticmethod
+    def _is_optional(value_type: Type) -> bool:
+        """Do check if type is optional."""
+        origin = _get_origin(value_type)
         if origin is types.UnionType or origin is typing.Union:
-            return types.NoneType in typing.get_args(value_type)
+            return _NONE_TYPE in _get_args(value_type)
         return False
 
     @staticmethod
     def remove_optional(value_type: Type) -> Type:
         """Remove optional qualifier."""
-        origin = typing.get_origin(value_type)
-        if origin is typing.Optional and len(typing.get_args(value_type)) == 1:
-            return typing.get_args(value_type)[0]
+        origin = _get_origin(value_type)
+        if origin is typing.Optional and len(_get_args(value_type)) == 1:
+            return _get_args(value_type)[0]
         else:  # Union of the form: T1 | T2 | ... | None
-            actual_types = tuple(subtype for subtype in typing.get_args(value_type) if subtype is not types.NoneType)
-            return typing.Union[actual_types]
+            # Cache by the ordered arguments rather than by the union itself:
+            # unions compare equal regardless of the order of their arguments.
+            return OptionalTypes._remove_none(_get_args(value_type))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _remove_none(union_args: Tuple[Type, ...]) -> Type:
+        """Create union of the given types except None."""
+        actual_types = tuple(subtype for subtype in union_args if subtype is not _NONE_TYPE)
+        return typing.Union[actual_types]
@@ -1,41 +1,65 @@
-import typing
-from typing import Type, Tuple
+import functools
+from typing import Type, Tuple, get_origin as _get_origin, get_args as _get_args
 
 
 class Tuples:
     """Utilities to work with tuples."""
 
+    # Tuple type kinds
+    NOT_TUPLE: str = "not_tuple"
+    UNTYPED: str = "untyped"
+    FIXED: str = "fixed"
+    ANY_LENGTH: str = "any_length"
+
+    @staticmethod
+    def kind(value_type: Type) -> str:
+        """Classify the tuple type (origin and arguments are inspected once)."""
+        try:
+            return Tuples._kind_cached(value_type)
+        except TypeError:  # Unhashable type
+            return Tuples._kind(value_type)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _kind_cached(value_type: Type) -> str:
+        """Classify the tuple type (cached)."""
+        return Tuples._kind(value_type)
+
+    @staticmethod
+    def _kind(value_type: Type) -> str:
+        """Do classify the tuple type."""
+        if value_type is not tuple and _get_origin(value_type) is not tuple:
+            return Tuples.NOT_TUPLE
+        item_types: Tuple[Type, ...] = _get_args(value_type)
+        if len(item_types) == 0:
+            return Tuples.UNTYPED
+        if len(item_types) == 2 and item_types[1] is Ellipsis:
+            return Tuples.ANY_LENGTH
+        return Tuples.FIXED
+
     @staticmethod
     def is_tuple(value_type: Type) -> bool:
         """Check if value type is a tuple."""
-        origin: Type = typing.get_origin(value_type)
-        return value_type is tuple or origin is tuple or origin is Tuple
+        return Tuples.kind(value_type) is not Tuples.NOT_TUPLE
 
     @staticmethod
     def is_untyped(value_type: Type) -> bool:
         """Check if type is a fixed-length tuple."""
-        return Tuples.is_tuple(value_type) and len(typing.get_args(value_type)) == 0
+        return Tuples.kind(value_type) is Tuples.UNTYPED
 
     @staticmethod
     def is_fixed(value_type: Type) -> bool:
         """Check if type is a fixed-length tuple."""
-        return (
-            Tuples.is_tuple(value_type) and not Tuples.is_any_length(value_type) and not Tuples.is_untyped(value_type)
-        )
+        return Tuples.kind(value_type) is Tuples.FIXED
 
     @staticmethod
     def is_any_length(value_type: Type) -> bool:
         """Check if type is any-length tuple."""
-        if not Tuples.is_tuple(value_type):
-            return False
-        item_types: Tuple[Type, ...] = typing.get_args(value_type)
-        if len(item_types) != 2:
-            return False
-        return item_types[1] is Ellipsis
+        return Tuples.kind(value_type) is Tuples.ANY_LENGTH
 
     @staticmethod
     def item_type(value_type: Type) -> Type:
         """Get item type is a var-length tuple type."""
         if not Tuples.is_any_length(value_type):
             raise ValueError(f"Not a variable-length tuple type: {value_type}")
-        return typing.get_args(value_type)[0]
+        return _get_args(value_type)[0]
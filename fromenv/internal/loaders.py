@@ -1,13 +1,13 @@
-import abc
+import collections.abc
 import dataclasses
+import functools
 import types
 import typing
-from abc import abstractmethod
 from collections.abc import Mapping
-from contextlib import contextmanager
 from dataclasses import dataclass
 from types import UnionType
-from typing import Type, Any, Dict, Sequence, Tuple, List, Iterator, TypeVar
+from typing import Type, Any, Dict, Sequence, Tuple, List, NamedTuple, Set
+from weakref import WeakKeyDictionary
 
 from fromenv.consts import FROM_ENV
 from fromenv.errors import (
@@ -22,8 +22,31 @@ from fromenv.internal.helpers.optionals import OptionalTypes
 from fromenv.internal.helpers.tuples import Tuples
 from fromenv.model import Metadata
 
+# Type introspection results depend only on the (hashable) type,
+# while the same types are inspected over and over during loading.
+# Only the origin is cached: union types compare equal regardless of
+# the order of their arguments, so cached arguments might come from
+# a differently ordered union and change the union loading priority.
+_cached_get_origin = functools.lru_cache(maxsize=1024)(typing.get_origin)
+_get_args = typing.get_args
 
-@dataclass(frozen=True)
+
+def _get_origin(value_type: Type) -> Type | None:
+    """Get (cached) type origin."""
+    try:
+        return _cached_get_origin(value_type)
+    except TypeError:  # Unhashable type (e.g. annotated with a dict)
+        return typing.get_origin(value_type)
+
+
+# Origins of the generic types loaded as lists
+_LIST_ORIGINS: frozenset = frozenset((list, collections.abc.Sequence))
+
+# Preformatted names of the most commonly used item indexes
+_INDEX_NAMES: Tuple[str, ...] = tuple(str(index) for index in range(256))
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
     """Loading configuration."""
 
@@ -31,7 +54,7 @@ class Config:
     sep: str = "_"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Value:
     """Represents a value that should be loaded."""
 
@@ -40,13 +63,20 @@ class Value:
     qual_name: str
     metadata: Metadata | None = None
 
+    def with_type(self, value_type: Type | UnionType) -> "Value":
+        """Create the same value with a different type."""
+        return Value(type=value_type, var_name=self.var_name, qual_name=self.qual_name, metadata=self.metadata)
+
 
-@dataclass
+@dataclass(slots=True)
 class Strategy:
     """Strategy represents a configurable logic which should be common across all loaders."""
 
     config: Config
     loaders: Sequence["Loader"] = dataclasses.field(default_factory=lambda: DEFAULT_LOADERS)
+    _loader_cache: Dict[Tuple[Type, bool], "Loader"] = dataclasses.field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
 
     def child_value(
         self, parent: Value, ref: Any, value_type: Type | UnionType, metadata: Metadata | None = None
@@ -60,6 +90,20 @@ class Strategy:
 
     def resolve_loader(self, value: Value) -> "Loader":
         """Resolve loader appropriate for the given value."""
+        # Only the custom loader depends on value metadata,
+        # other loaders are selected by the value type alone.
+        key = (value.type, value.metadata is not None and value.metadata.load is not None)
+        try:
+            loader = self._loader_cache.get(key)
+        except TypeError:  # Unhashable type
+            return self._find_loader(value)
+        if loader is None:
+            loader = self._find_loader(value)
+            self._loader_cache[key] = loader
+        return loader
+
+    def _find_loader(self, value: Value) -> "Loader":
+        """Find the first loader that can handle the given value."""
         for loader in self.loaders:
             if loader.can_load(value):
                 return loader
@@ -75,11 +119,36 @@ class Strategy:
 
     def child_var_name(self, parent: Value, ref: Any) -> str:
         """Compute child-value name from parent-value and reference from parent to child."""
-        this_name = str(ref).upper()
+        if isinstance(ref, int):  # Item index, no need to change case
+            this_name = _INDEX_NAMES[ref] if ref < len(_INDEX_NAMES) else str(ref)
+        else:
+            this_name = str(ref).upper()
         if parent.var_name:
             return f"{parent.var_name}{self.config.sep}{this_name}"
         return this_name
 
+    def field_value(self, parent: Value, field: "FieldPlan") -> Value:
+        """Create data class field value using precomputed field details."""
+        if field.metadata is not None and field.metadata.name is not None:
+            var_name = field.metadata.name
+        elif parent.var_name:
+            var_name = f"{parent.var_name}{self.config.sep}{field.upper_name}"
+        else:
+            var_name = field.upper_name
+        qual_name = f"{parent.qual_name}.{field.name}"
+        return Value(type=field.type, var_name=var_name, qual_name=qual_name, metadata=field.metadata)
+
+    def item_var_prefix(self, parent: Value) -> str:
+        """Compute the variable name prefix shared by all sequence items."""
+        if parent.var_name:
+            return f"{parent.var_name}{self.config.sep}"
+        return ""
+
+    def item_value(self, parent: Value, var_prefix: str, index: int, item_type: Type | UnionType) -> Value:
+        """Create sequence item value using the precomputed variable name prefix."""
+        index_name = _INDEX_NAMES[index] if index < len(_INDEX_NAMES) else str(index)
+        return Value(type=item_type, var_name=var_prefix + index_name, qual_name=f"{parent.qual_name}[{index_name}]")
+
     def child_qual_name(self, parent: Value, ref: Any) -> str:
         """Compute child qualified name from the given parent and value reference."""
         if DataClasses.is_dataclass(parent.type):
@@ -92,7 +161,6 @@ class Strategy:
         return loader.load(env, value, self)
 
 
-@dataclass
 class BindingChanges:
     """Summary of changes in value bindings."""
 
@@ -106,68 +174,72 @@ class BindingChanges:
     # There are certain cases in which we need to know if
     # the value was produced without consuming any variables:
 
+    __slots__ = ("footprint", "_bound", "_bound_before")
+
     footprint: int  # Amount of variables consumed
 
+    def __init__(self, bound: Dict[str, "Value"]):
+        self.footprint = 0
+        self._bound = bound
+        self._bound_before = 0
+
+    def __enter__(self) -> "BindingChanges":
+        self._bound_before = len(self._bound)
+        return self
+
+    def __exit__(self, *exc_info):
+        self.footprint = len(self._bound) - self._bound_before
+
 
-@dataclass
+@dataclass(slots=True)
 class VarBinding:
     """Environment variables mapped to the corresponding values."""
 
     vars: Mapping[str, str]
     bound: Dict[str, Value] = dataclasses.field(default_factory=dict)
-
-    def bind(self, value: Value):
-        """Bind variable to the given value"""
-        if value.var_name not in self.vars:
+    presence: Dict[Tuple[Type, str | None], bool] = dataclasses.field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+    union_choices: Dict[Tuple[Tuple[Type, ...], str | None], Type | None] = dataclasses.field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+
+    def bind(self, value: Value) -> str:
+        """Bind variable to the given value and get the raw variable value."""
+        raw_value = self.vars.get(value.var_name)
+        if raw_value is None:
             raise MissingRequiredVar(value.var_name, value.qual_name)
-        if value.var_name in self.bound:
-            other = self.bound[value.var_name]
+        other = self.bound.get(value.var_name)
+        if other is not None:
             raise AmbiguousVarError(value.var_name, other.qual_name, value.qual_name)
         self.bound[value.var_name] = value
+        return raw_value
 
-    @contextmanager
-    def track_changes(self) -> Iterator[BindingChanges]:
+    def track_changes(self) -> BindingChanges:
         """Track binding changes."""
-        bound_before: int = len(self.bound)
-        changes = BindingChanges(0)
-        yield changes
-        bound_after: int = len(self.bound)
-        changes.footprint = bound_after - bound_before
+        return BindingChanges(self.bound)
 
 
-class Loader(abc.ABC):
+class Loader:
     """Loader encapsulate type-specific loading logic."""
 
-    @abstractmethod
     def can_load(self, value: Value) -> bool:
         """Check if loader can handle the value."""
+        raise NotImplementedError
 
-    @abstractmethod
     def load(self, env: VarBinding, value: Value, strategy: Strategy) -> Any:
         """Do load value from the environment variables."""
+        raise NotImplementedError
 
-    @abstractmethod
     def is_present(self, env: VarBinding, value: Value, strategy: Strategy) -> bool:
         """Check if ALL variables required to successfully load the value are defined."""
+        raise NotImplementedError
 
-
-T = TypeVar("T")
-
-
-class LoadingHelper:
-    """Provides convenience methods for loaders."""
-
-    def __init__(self, env: VarBinding, value: Value, strategy: Strategy):
-        self.env: VarBinding = env
-        self.value: Value = value
-        self.strategy: Strategy = strategy
-
-    def load_if_present(self, child_ref: Any, child_type: Type[T]) -> T | None:
-        """Load child value if present."""
-        child_value = self.strategy.child_value(self.value, child_ref, child_type)
-        child_loader = self.strategy.resolve_loader(child_value)
-        if child_loader.is_present(self.env, child_value, self.strategy):
-            return child_loader.load(self.env, child_value, self.strategy)
+    def try_load(self, env: VarBinding, value: Value, strategy: Strategy) -> Tuple[bool, Any]:
+        """Load value only if it is present. Returns presence flag and the loaded value."""
+        if not self.is_present(env, value, strategy):
+            return False, None
+        return True, self.load(env, value, strategy)
 
 
 class BasicValueLoader(Loader):
@@ -189,8 +261,7 @@ class BasicValueLoader(Loader):
 
     def load(self, env: VarBinding, value: Value, strategy: Strategy) -> Any:
         """Do load value."""
-        env.bind(value)
-        raw_value = env.vars[value.var_name]
+        raw_value = env.bind(value)
         try:
             return self.type(raw_value)
         except ValueError as error:
@@ -201,20 +272,33 @@ class BasicValueLoader(Loader):
         return value.var_name in env.vars
 
 
+class StrLoader(BasicValueLoader):
+    """A basic value loader for string values."""
+
+    def __init__(self):
+        super().__init__(str)
+
+    def load(self, env: VarBinding, value: Value, strategy: Strategy) -> str:
+        """Load string value (variables are strings already, no conversion needed)."""
+        return env.bind(value)
+
+
 class BooleanLoader(BasicValueLoader):
     """A basic value loader for boolean values."""
 
+    TRUE: frozenset = frozenset(("true", "1", "yes"))
+    FALSE: frozenset = frozenset(("false", "0", "no"))
+
     def __init__(self):
         super().__init__(bool)
 
     def load(self, env: VarBinding, value: Value, strategy: Strategy) -> bool:
         """Load boolean value."""
-        env.bind(value)
-        raw_value: str = env.vars[value.var_name].upper()
-        normalized: str = raw_value.upper().strip()
-        if normalized == "TRUE" or normalized == "1" or normalized == "YES":
+        raw_value: str = env.bind(value)
+        normalized: str = raw_value.strip().casefold()
+        if normalized in self.TRUE:
             return True
-        elif normalized == "FALSE" or normalized == "0" or normalized == "NO":
+        elif normalized in self.FALSE:
             return False
         raise InvalidVariableFormat(value.var_name, value.qual_name, cause=f"invalid boolean format: '{raw_value}'")
 
@@ -231,9 +315,9 @@ class CustomLoader(Loader):
 
     def load(self, env: VarBinding, value: Value, strategy: Strategy) -> Any:
         """Do load the value with a custom loader."""
-        env.bind(value)
+        raw_value = env.bind(value)
         try:
-            return value.metadata.load(env.vars[value.var_name])
+            return value.metadata.load(raw_value)
         except ValueError as error:
             raise InvalidVariableFormat(value.var_name, value.qual_name, cause=str(error))
 
@@ -242,6 +326,22 @@ class CustomLoader(Loader):
         return value.var_name in env.vars
 
 
+class FieldPlan(NamedTuple):
+    """Precomputed loading details of a data class field."""
+
+    field: dataclasses.Field
+    name: str
+    upper_name: str
+    type: Type
+    metadata: Metadata | None
+    has_default: bool
+
+
+# Field plans are weakly keyed by data classes, so they are dropped with their classes
+# (which are kept alive by the recently used from_env plans and by recursive field types)
+_FIELD_PLANS: "WeakKeyDictionary[Type, Tuple[FieldPlan, ...]]" = WeakKeyDictionary()
+
+
 class DataClassLoader(Loader):
     """Data class loader."""
 
@@ -253,22 +353,26 @@ class DataClassLoader(Loader):
         """Do load data class instance."""
         data_class: Type = value.type
         constructor_arguments: Dict[str, Any] = {}
-        for field in dataclasses.fields(data_class):
-            metadata: Metadata = self._resolve_metadata(value, field)
-            field_value = strategy.child_value(value, field.name, field.type, metadata)
-            field_loader = strategy.resolve_loader(field_value)
-            is_present = field_loader.is_present(env, field_value, strategy)
-            has_default = DataClasses.has_default(field)
-            if has_default and not is_present:
-                continue
+        field_value_of = strategy.field_value
+        resolve_loader = strategy.resolve_loader
+        track_changes = env.track_changes
+        for field in self._field_plan(data_class):
+            field_value = field_value_of(value, field)
+            field_loader = resolve_loader(field_value)
+            has_default = field.has_default
 
             # If the field is required but not present, exception should be raised by any of
             # the downstream loaders, so the error message will be as specific as possible.
             # That's why we shouldn't raise MissingRequiredVar exception here and should
-            # always try to load the value instead.
-
-            with env.track_changes() as changes:
-                loaded_value = field_loader.load(env, field_value, strategy)
+            # always try to load the value instead (no need to check presence beforehand).
+
+            with track_changes() as changes:
+                if has_default:
+                    is_present, loaded_value = field_loader.try_load(env, field_value, strategy)
+                else:
+                    is_present, loaded_value = True, field_loader.load(env, field_value, strategy)
+            if not is_present:
+                continue
 
             # Some of the value types (like nullables and lists) may be successfully loaded
             # without consuming any environment variables. In such cases the  produced value
@@ -277,13 +381,119 @@ class DataClassLoader(Loader):
             # used instead of the type-specific one:
 
             if changes.footprint == 0 and has_default:
-                loaded_value = DataClasses.default_value(field)
+                loaded_value = DataClasses.default_value(data_class, field.field)
 
             constructor_arguments[field.name] = loaded_value
         return data_class(**constructor_arguments)
 
     @staticmethod
-    def _resolve_metadata(data: Value, field: dataclasses.Field) -> Metadata | None:
+    def _field_plan(data_class: Type) -> Tuple[FieldPlan, ...]:
+        """Get (cached) loading details for each data class field."""
+        field_plan = _FIELD_PLANS.get(data_class)
+        if field_plan is None:
+            field_plan = DataClassLoader._make_field_plan(data_class)
+            _FIELD_PLANS[data_class] = field_plan
+        return field_plan
+
+    @staticmethod
+    def _make_field_plan(data_class: Type) -> Tuple[FieldPlan, ...]:
+        """Compute loading details for each data class field."""
+        info = DataClasses.info(data_class)
+        DataClassLoader._check_recursion(data_class, info.types)
+        return tuple(
+            FieldPlan(
+                field=field,
+                name=field.name,
+                upper_name=field.name.upper(),
+                type=info.types[field.name],
+                metadata=DataClassLoader._resolve_metadata(data_class, field),
+                has_default=DataClasses.has_default(field),
+            )
+            for field in info.fields
+        )
+
+    @staticmethod
+    def _check_recursion(data_class: Type, field_types: Dict[str, Type]):
+        """Make sure required fields don't unconditionally lead back to the same data class."""
+        # Such values could never be completely loaded, while checking their presence would never stop.
+        # Optional values and sequence items are loaded only if present, so the cycles through them
+        # are fine as long as their presence depends on some variables.
+        for field in DataClassLoader._required_fields(data_class):
+            visited: Set[Type] = set()
+            pending: List[Type] = [field_types[field.name]]
+            while pending:
+                current = pending.pop()
+                if current is data_class:
+                    raise UnsupportedValueType(
+                        qual_name=f"{data_class.__name__}.{field.name}",
+                        value_type=field_types[field.name],
+                        message=f"{data_class.__name__}.{field.name} recursively requires {data_class.__name__}",
+                    )
+                if DataClasses.is_dataclass(current):
+                    if current not in visited:
+                        visited.add(current)
+                        nested_types = DataClasses.info(current).types
+                        pending.extend(
+                            nested_types[nested.name] for nested in DataClassLoader._required_fields(current)
+                        )
+                    continue
+                checked_type = DataClassLoader._presence_checked_type(current)
+                if checked_type is None:
+                    pending.extend(_get_args(current))  # Union arms, fixed-length tuple items
+                elif not DataClassLoader._requires_vars(checked_type, set()):
+                    pending.append(checked_type)
+
+    @staticmethod
+    def _required_fields(data_class: Type) -> List[dataclasses.Field]:
+        """Get required fields without custom loaders."""
+        return [
+            field
+            for field in DataClasses.required_fields(data_class)
+            if not DataClassLoader._has_custom_loader(data_class, field)
+        ]
+
+    @staticmethod
+    def _has_custom_loader(data_class: Type, field: dataclasses.Field) -> bool:
+        """Check if the field is loaded by the custom loader."""
+        metadata = DataClassLoader._resolve_metadata(data_class, field)
+        return metadata is not None and metadata.load is not None
+
+    @staticmethod
+    def _presence_checked_type(value_type: Type) -> Type | None:
+        """Get the type which is loaded only if present (optional value or sequence item type)."""
+        if OptionalTypes.is_optional(value_type):
+            return OptionalTypes.remove_optional(value_type)
+        if Tuples.is_any_length(value_type):
+            return Tuples.item_type(value_type)
+        if _get_origin(value_type) in _LIST_ORIGINS:
+            type_args = _get_args(value_type)
+            return type_args[0] if type_args else None
+        return None
+
+    @staticmethod
+    def _requires_vars(value_type: Type, path: Set[Type]) -> bool:
+        """Check if the value of the given type always consumes some variables."""
+        if DataClasses.is_dataclass(value_type):
+            if value_type in path:
+                return False  # Recursive data class
+            path = path | {value_type}
+            field_types = DataClasses.info(value_type).types
+            return any(
+                DataClassLoader._has_custom_loader(value_type, field)
+                or DataClassLoader._requires_vars(field_types[field.name], path)
+                for field in DataClasses.required_fields(value_type)
+            )
+        if DataClassLoader._presence_checked_type(value_type) is not None:
+            return False
+        origin = _get_origin(value_type)
+        if origin is typing.Union or origin is types.UnionType:
+            return all(DataClassLoader._requires_vars(arg, path) for arg in _get_args(value_type))
+        if Tuples.is_fixed(value_type):
+            return any(DataClassLoader._requires_vars(arg, path) for arg in _get_args(value_type))
+        return True  # Basic values
+
+    @staticmethod
+    def _resolve_metadata(data_class: Type, field: dataclasses.Field) -> Metadata | None:
         """Resolve value metadata."""
         if FROM_ENV not in field.metadata:
             return None
@@ -294,15 +504,33 @@ class DataClassLoader(Loader):
             return Metadata(name=metadata)
         elif isinstance(metadata, Metadata):
             return metadata
-        raise TypeError(f"Unexpected type for field metadata: {data.qual_name}.{field.name}: {type(metadata)}")
+        raise TypeError(f"Unexpected type for field metadata: {data_class.__name__}.{field.name}: {type(metadata)}")
 
     def is_present(self, env: VarBinding, value: Value, strategy: Strategy) -> bool:
         """Check if required fields are present."""
-        for field in DataClasses.required_fields(value.type):
-            field_value = strategy.child_value(value, field.name, field.type)
-            field_loader = strategy.resolve_loader(field_value)
-            if not field_loader.is_present(env, field_value, strategy):
-                return False
+        # Presence depends on the variables only (not on the bindings),
+        # so the result may be reused for repeated probes (e.g. by unions).
+        key = (value.type, value.var_name)
+        is_present = env.presence.get(key)
+        if is_present is None:
+            is_present = env.presence[key] = self._check_present(env, value, strategy)
+        return is_present
+
+    def _check_present(self, env: VarBinding, value: Value, strategy: Strategy) -> bool:
+        """Do check if required fields are present."""
+        # Nested data classes are traversed iteratively rather than recursively
+        pending: List[Value] = [value]
+        while pending:
+            current: Value = pending.pop()
+            for field in self._field_plan(current.type):
+                if field.has_default:
+                    continue
+                field_value = strategy.field_value(current, field)
+                field_loader = strategy.resolve_loader(field_value)
+                if field_loader is self:
+                    pending.append(field_value)
+                elif not field_loader.is_present(env, field_value, strategy):
+                    return False
         return True
 
 
@@ -311,57 +539,76 @@ class UnionLoader(Loader):
 
     def can_load(self, value: Value) -> bool:
         """Check if this is a union class."""
-        origin = typing.get_origin(value.type)
+        origin = _get_origin(value.type)
         return origin is typing.Union or origin is types.UnionType
 
     def load(self, env: VarBinding, value: Value, strategy: Strategy) -> Any:
         """Do load union-typed value."""
-        for actual_type in typing.get_args(value.type):
-            casted = dataclasses.replace(value, type=actual_type)
-            loader = strategy.resolve_loader(casted)
-            if loader.is_present(env, casted, strategy):
-                return loader.load(env, casted, strategy)
-        raise UnionLoadingError(qual_name=value.qual_name, value_type=value.type)
+        casted = self._choose(env, value, strategy)
+        if casted is None:
+            raise UnionLoadingError(qual_name=value.qual_name, value_type=value.type)
+        return strategy.load(env, casted)
 
     def is_present(self, env: VarBinding, value: Value, strategy: Strategy) -> bool:
         """Check if some of the united types could be loaded."""
-        for actual_type in typing.get_args(value.type):
-            casted = dataclasses.replace(value, type=actual_type)
+        return self._choose(env, value, strategy) is not None
+
+    @staticmethod
+    def _choose(env: VarBinding, value: Value, strategy: Strategy) -> Value | None:
+        """Get the value casted to the first present united type (if any)."""
+        # The choice depends on the variables only, so it is reused by the
+        # subsequent load after a presence check. Key by the ordered arguments
+        # as unions compare equal regardless of the order of their arguments.
+        union_args = _get_args(value.type)
+        key = (union_args, value.var_name)
+        if key in env.union_choices:
+            actual_type = env.union_choices[key]
+            return value.with_type(actual_type) if actual_type is not None else None
+        for actual_type in union_args:
+            casted = value.with_type(actual_type)
             loader = strategy.resolve_loader(casted)
             if loader.is_present(env, casted, strategy):
-                return True
-        return False
+                env.union_choices[key] = actual_type
+                return casted
+        env.union_choices[key] = None
+        return None
 
 
-class ListLoader(Loader):
-    """List loader."""
+class SequenceLoader(Loader):
+    """Common logic of the variable-length sequence loaders."""
 
     LENGTH_ATTR: str = "LEN"
 
-    def can_load(self, value: Value) -> bool:
-        """Check if the value type is list."""
-        origin = typing.get_origin(value.type)
-        return value == list or origin is list or origin is List or origin is typing.Sequence
-
-    def load(self, env: VarBinding, value: Value, strategy: Strategy) -> List:
-        """Do load list value."""
+    def _load_items(self, env: VarBinding, value: Value, strategy: Strategy, item_type: Type) -> List:
+        """Load sequence items."""
         # Check if length is specified explicitly
-        helper = LoadingHelper(env, value, strategy)
-        length = helper.load_if_present(self.LENGTH_ATTR, int)
+        var_prefix: str = strategy.item_var_prefix(value)
+        length: int | None = None
+        if var_prefix + self.LENGTH_ATTR in env.vars:
+            length = strategy.load(env, strategy.child_value(value, self.LENGTH_ATTR, int))
 
         items: List = []
-        item_type: Type = self._item_type(value)
+        first_item: Value = strategy.item_value(value, var_prefix, 0, item_type)
+        item_loader: Loader = strategy.resolve_loader(first_item)
 
         if length is not None:
             # Load certain number of items
             for current_index in range(length):
-                current_item: Value = strategy.child_value(value, current_index, item_type)
-                loaded_item_value = strategy.load(env, current_item)
+                current_item: Value = strategy.item_value(value, var_prefix, current_index, item_type)
+                loaded_item_value = item_loader.load(env, current_item, strategy)
                 items.append(loaded_item_value)
+        elif isinstance(item_loader, BasicValueLoader):
+            # Basic items always consume exactly one variable,
+            # so items are loaded until the next variable is missing.
+            current_index: int = 0
+            current_item: Value = first_item
+            while current_item.var_name in env.vars:
+                items.append(item_loader.load(env, current_item, strategy))
+                current_index += 1
+                current_item = strategy.item_value(value, var_prefix, current_index, item_type)
         else:
             current_index: int = 0
-            current_item: Value = strategy.child_value(value, current_index, item_type)
-            item_loader: Loader = strategy.resolve_loader(current_item)
+            current_item: Value = first_item
 
             # Load items until present
             while item_loader.is_present(env, current_item, strategy):
@@ -370,27 +617,40 @@ class ListLoader(Loader):
 
                 # Stop loading if value doesn't consume any environment variables.
                 # Otherwise, we may end up loading infinitely many type-specific
-                # default values (determined by the list's item type).
+                # default values (determined by the sequence item type).
                 if changes.footprint == 0:
                     break
 
                 items.append(loaded_item_value)
                 current_index += 1
-                current_item = strategy.child_value(value, current_index, item_type)
+                current_item = strategy.item_value(value, var_prefix, current_index, item_type)
         return items
 
+    def is_present(self, env: VarBinding, value: Value, strategy: Strategy) -> bool:
+        """Check if sequence is present."""
+        return True  # Sequence may be empty in which case no variables are required
+
+
+class ListLoader(SequenceLoader):
+    """List loader."""
+
+    def can_load(self, value: Value) -> bool:
+        """Check if the value type is list."""
+        # Only the origin is looked up in the set: the type itself may be unhashable
+        return value.type is list or _get_origin(value.type) in _LIST_ORIGINS
+
+    def load(self, env: VarBinding, value: Value, strategy: Strategy) -> List:
+        """Do load list value."""
+        return self._load_items(env, value, strategy, self._item_type(value))
+
     @staticmethod
     def _item_type(value: Value) -> Type:
         """Get item type."""
-        type_args: Tuple[Type, ...] = typing.get_args(value.type)
+        type_args: Tuple[Type, ...] = _get_args(value.type)
         if not type_args:
             raise UnsupportedValueType(qual_name=value.qual_name, value_type=value.type)
         return type_args[0]
 
-    def is_present(self, env: VarBinding, value: Value, strategy: Strategy) -> bool:
-        """Check if list is present."""
-        return True  # List may be empty in which case it is also present.
-
 
 class FixedLengthTupleLoader(Loader):
     """Fixed-length tuples loader."""
@@ -402,7 +662,7 @@ class FixedLengthTupleLoader(Loader):
     def load(self, env: VarBinding, value: Value, strategy: Strategy) -> Any:
         """Do load fixed-length tuple."""
         items: List[Any] = []
-        item_types = typing.get_args(value.type)
+        item_types = _get_args(value.type)
         for index, item_type in enumerate(item_types):
             item = strategy.child_value(value, index, item_type)
             item_loader = strategy.resolve_loader(item)
@@ -412,7 +672,7 @@ class FixedLengthTupleLoader(Loader):
 
     def is_present(self, env: VarBinding, value: Value, strategy: Strategy) -> bool:
         """Check if fixed-length tuple is correctly represented by the variables."""
-        item_types = typing.get_args(value.type)
+        item_types = _get_args(value.type)
         for index, item_type in enumerate(item_types):
             item = strategy.child_value(value, index, item_type)
             item_loader = strategy.resolve_loader(item)
@@ -421,54 +681,16 @@ class FixedLengthTupleLoader(Loader):
         return True
 
 
-class AnyLengthTupleLoader(Loader):
+class AnyLengthTupleLoader(SequenceLoader):
     """Any-length tuples loader."""
 
-    LENGTH_ATTR: str = "LEN"
-
     def can_load(self, value: Value) -> bool:
         """Check if value type is tuple."""
         return Tuples.is_any_length(value.type)
 
     def load(self, env: VarBinding, value: Value, strategy: Strategy) -> Any:
         """Do load the tuple."""
-        # Check if length is specified explicitly
-        helper = LoadingHelper(env, value, strategy)
-        length = helper.load_if_present(self.LENGTH_ATTR, int)
-
-        items: List = []
-        item_type: Type = Tuples.item_type(value.type)
-
-        if length is not None:
-            # Load specified number of items
-            for current_index in range(length):
-                current_item: Value = strategy.child_value(value, current_index, item_type)
-                loaded_item_value = strategy.load(env, current_item)
-                items.append(loaded_item_value)
-        else:
-            current_index: int = 0
-            current_item: Value = strategy.child_value(value, current_index, item_type)
-            item_loader: Loader = strategy.resolve_loader(current_item)
-
-            # Load items until present
-            while item_loader.is_present(env, current_item, strategy):
-                with env.track_changes() as changes:
-                    loaded_item_value = item_loader.load(env, current_item, strategy)
-
-                # Stop loading if value doesn't consume any environment variables.
-                # Otherwise, we may end up loading infinitely many type-specific
-                # default values (determined by the tuple's item type).
-                if changes.footprint == 0:
-                    break
-
-                items.append(loaded_item_value)
-                current_index += 1
-                current_item = strategy.child_value(value, current_index, item_type)
-        return tuple(items)
-
-    def is_present(self, env: VarBinding, value: Value, strategy: Strategy) -> bool:
-        """Check if tuple is present."""
-        return True  # Tuple may be empty in which case no variables are required
+        return tuple(self._load_items(env, value, strategy, Tuples.item_type(value.type)))
 
 
 class OptionalLoader(Loader):
@@ -491,7 +713,7 @@ class OptionalLoader(Loader):
 
         # Otherwise, load the optional value if it is present
         actual_type = OptionalTypes.remove_optional(value.type)
-        actual_value = dataclasses.replace(value, type=actual_type)
+        actual_value = value.with_type(actual_type)
         loader = strategy.resolve_loader(actual_value)
         if loader.is_present(env, actual_value, strategy):
             with env.track_changes() as changes:
@@ -515,7 +737,7 @@ DEFAULT_LOADERS: Tuple[Loader, ...] = (
     OptionalLoader(),
     BasicValueLoader(int),
     BasicValueLoader(float),
-    BasicValueLoader(str),
+    StrLoader(),
     BooleanLoader(),
     DataClassLoader(),
     UnionLoader(),
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Callable, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Metadata:
     """User-supplied field metadata."""
 
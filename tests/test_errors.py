@@ -0,0 +1,50 @@
+import pickle
+
+import pytest
+
+from fromenv.errors import MissingRequiredVar, AmbiguousVarError, UnsupportedValueType, UnionLoadingError
+
+_ERRORS = [
+    (
+        MissingRequiredVar("VALUE", "TestData.value"),
+        "Variable 'VALUE' not found (required for TestData.value)",
+    ),
+    (
+        AmbiguousVarError("VALUE", "TestData.value", "TestData.nested.value"),
+        "Variable 'VALUE' has ambiguous binding:\n\t1. TestData.value\n\t2. TestData.nested.value",
+    ),
+    (
+        UnsupportedValueType("TestData.value", dict),
+        "TestData.value has unsupported type: <class 'dict'>",
+    ),
+    (
+        UnionLoadingError("TestData.value", int | str),
+        "None of the union type alternatives could be loaded for TestData.value",
+    ),
+]
+
+
+@pytest.mark.parametrize("error,expected", _ERRORS)
+def test_default_message(error, expected):
+    assert str(error) == expected
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        MissingRequiredVar("VALUE", "TestData.value", message="custom"),
+        AmbiguousVarError("VALUE", "TestData.value", "TestData.nested.value", message="custom"),
+        UnsupportedValueType("TestData.value", dict, message="custom"),
+        UnionLoadingError("TestData.value", int | str, message="custom"),
+    ],
+)
+def test_explicit_message(error):
+    assert str(error) == "custom"
+
+
+@pytest.mark.parametrize("error,expected", _ERRORS)
+def test_pickle(error, expected):
+    restored = pickle.loads(pickle.dumps(error))
+    assert type(restored) is type(error)
+    assert restored.args == error.args
+    assert str(restored) == expected
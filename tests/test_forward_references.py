@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Annotated, List, Optional
+
+import pytest
+
+from fromenv import from_env
+from fromenv.errors import UnsupportedValueType
+
+
+@dataclass
+class _Nested:
+    value: int
+
+
+@dataclass
+class _Data:
+    nested: _Nested
+    optional: Optional[_Nested] = None
+    items: List[_Nested] = field(default_factory=list)
+    number: int | None = None
+
+
+def test_forward_references():
+    env = {"NESTED_VALUE": "1", "OPTIONAL_VALUE": "2", "ITEMS_0_VALUE": "3", "NUMBER": "4"}
+    assert from_env(_Data, env) == _Data(_Nested(1), _Nested(2), [_Nested(3)], 4)
+    assert from_env(_Data, {"NESTED_VALUE": "1"}) == _Data(_Nested(1))
+
+
+def test_unresolvable_forward_references():
+    @dataclass
+    class Local:
+        value: int
+
+    @dataclass
+    class TestData:
+        local: Local
+
+    with pytest.raises(UnsupportedValueType):
+        from_env(TestData, {"LOCAL_VALUE": "42"})
+
+
+def test_annotated_forward_references():
+    @dataclass
+    class TestData:
+        nested: _Nested
+        annotated: Annotated[int, "extra"]
+
+    with pytest.raises(UnsupportedValueType):
+        from_env(TestData, {"NESTED_VALUE": "1", "ANNOTATED": "42"})
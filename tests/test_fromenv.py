@@ -1,72 +1,184 @@
 import dataclasses
 import json
 from dataclasses import dataclass, field
-from typing import Union, List, Tuple, Optional, Dict
+from types import MappingProxyType
+from typing import Union, List, Tuple, Optional, Dict, Sequence, Annotated
 
 import pytest
 
 from fromenv import from_env, MissingRequiredVar, Config, AmbiguousVarError
-from fromenv.errors import InvalidVariableFormat
+from fromenv.errors import InvalidVariableFormat, UnsupportedValueType
 from fromenv.model import Metadata
 
+_JSON_METADATA = {"fromenv": Metadata(load=json.loads)}
+_OVERRIDE_NAME_METADATA = {"fromenv": Metadata(name="OVERRIDE_NAME")}
 
-def test_int_value():
-    @dataclass
-    class TestData:
-        int_value: int
+_CUSTOM_SEPARATOR_ENV = MappingProxyType(
+    {
+        "NESTED__VALUE": "specified",
+        "LIST__0": "1",
+        "LIST__1": "2",
+    }
+)
+
+_FIXED_TUPLE_ENV = MappingProxyType(
+    {
+        "FIRST_0": "100",
+        "FIRST_1": "first-str",
+        "FIRST_2": "false",
+        "SECOND_0": "200",
+        "SECOND_1": "second-str",
+        "SECOND_2": "true",
+    }
+)
+
+_NESTED_TUPLES_ENV = MappingProxyType(
+    {
+        "TUPLE_0": "0",
+        "TUPLE_1": "str-outer",
+        "TUPLE_2_0": "1",
+        "TUPLE_2_1": "str-nested",
+        "TUPLE_2_2_0": "str-deepest-1",
+        "TUPLE_2_2_1": "str-deepest-2",
+    }
+)
 
-    assert from_env(TestData, {"INT_VALUE": "42"}).int_value == 42
-    with pytest.raises(MissingRequiredVar):
-        from_env(TestData, {})
-    with pytest.raises(InvalidVariableFormat):
-        from_env(TestData, {"INT_VALUE": "invalid"})
 
+@dataclass
+class _IntData:
+    int_value: int
 
-def test_float_value():
-    @dataclass
-    class TestData:
-        float_value: float
 
-    assert from_env(TestData, {"FLOAT_VALUE": "4.2"}).float_value == 4.2
-    with pytest.raises(MissingRequiredVar):
-        from_env(TestData, {})
-    with pytest.raises(InvalidVariableFormat):
-        from_env(TestData, {"FLOAT_VALUE": "invalid"})
+@dataclass
+class _FloatData:
+    float_value: float
 
 
-def test_str_value():
-    @dataclass
-    class TestData:
-        str_value: str
+@dataclass
+class _StrData:
+    str_value: str
+
+
+@pytest.mark.parametrize(
+    "data_class,env,expected",
+    [
+        (_IntData, {"INT_VALUE": "42"}, _IntData(42)),
+        (_FloatData, {"FLOAT_VALUE": "4.2"}, _FloatData(4.2)),
+        (_StrData, {"STR_VALUE": "specified"}, _StrData("specified")),
+    ],
+)
+def test_scalar_value(data_class, env, expected):
+    assert from_env(data_class, env) == expected
+
+
+@dataclass
+class _BoolData:
+    bool_value: bool
+
+
+@pytest.mark.parametrize(
+    "raw,expected",
+    [
+        ("true", True),
+        ("TrUe", True),
+        ("yes", True),
+        ("1", True),
+        ("faLSe", False),
+        ("FALSE", False),
+        ("no", False),
+        ("0", False),
+    ],
+)
+def test_bool_value(raw, expected):
+    assert from_env(_BoolData, {"BOOL_VALUE": raw}).bool_value is expected
 
-    assert from_env(TestData, {"STR_VALUE": "specified"}).str_value == "specified"
-    with pytest.raises(MissingRequiredVar):
-        from_env(TestData, {})
 
+@pytest.mark.parametrize(
+    "data_class,env,error",
+    [
+        (_IntData, {}, MissingRequiredVar),
+        (_IntData, {"INT_VALUE": "invalid"}, InvalidVariableFormat),
+        (_FloatData, {}, MissingRequiredVar),
+        (_FloatData, {"FLOAT_VALUE": "invalid"}, InvalidVariableFormat),
+        (_StrData, {}, MissingRequiredVar),
+        (_BoolData, {}, MissingRequiredVar),
+        (_BoolData, {"BOOL_VALUE": "invalid"}, InvalidVariableFormat),
+    ],
+)
+def test_scalar_value_errors(data_class, env, error):
+    with pytest.raises(error):
+        from_env(data_class, env)
 
-def test_bool_value():
+
+@dataclass
+class _Recursive:
+    recursive: "_Recursive"
+
+
+@dataclass
+class _RecursiveUnion:
+    value: "Union[_RecursiveUnion, str]"
+
+
+@dataclass
+class _RecursiveList:
+    items: "list[_RecursiveList]"
+
+
+@dataclass
+class _RecursiveOptional:
+    next: "_RecursiveOptional | None"
+
+
+@dataclass
+class _Node:
+    value: int
+    next: "_Node | None"
+
+
+@dataclass
+class _Tree:
+    value: int
+    children: "list[_Tree]"
+
+
+@dataclass
+class _LinkedNode:
+    value: int
+    next: "_LinkedNode | None" = None
+
+
+@pytest.mark.parametrize("data_class", [_Recursive, _RecursiveUnion, _RecursiveList, _RecursiveOptional])
+def test_recursive_required_fields(data_class):
+    with pytest.raises(UnsupportedValueType):
+        from_env(data_class, {})
+
+
+def test_recursive_field_with_default():
+    assert from_env(_LinkedNode, {"VALUE": "1", "NEXT_VALUE": "2"}) == _LinkedNode(1, _LinkedNode(2))
+
+
+def test_recursive_optional_field():
+    assert from_env(_Node, {"VALUE": "1", "NEXT_VALUE": "2"}) == _Node(1, _Node(2, None))
+
+
+def test_recursive_list_field():
+    env = {"VALUE": "1", "CHILDREN_0_VALUE": "2", "CHILDREN_0_CHILDREN_0_VALUE": "3"}
+    assert from_env(_Tree, env) == _Tree(1, [_Tree(2, [_Tree(3, [])])])
+
+
+def test_recursive_field_with_custom_format():
     @dataclass
     class TestData:
-        bool_value: bool
+        nested: "TestData" = field(metadata=_JSON_METADATA)
 
-    assert from_env(TestData, {"BOOL_VALUE": "true"}).bool_value is True
-    assert from_env(TestData, {"BOOL_VALUE": "TrUe"}).bool_value is True
-    assert from_env(TestData, {"BOOL_VALUE": "yes"}).bool_value is True
-    assert from_env(TestData, {"BOOL_VALUE": "1"}).bool_value is True
-    assert from_env(TestData, {"BOOL_VALUE": "faLSe"}).bool_value is False
-    assert from_env(TestData, {"BOOL_VALUE": "FALSE"}).bool_value is False
-    assert from_env(TestData, {"BOOL_VALUE": "no"}).bool_value is False
-    assert from_env(TestData, {"BOOL_VALUE": "0"}).bool_value is False
-    with pytest.raises(MissingRequiredVar):
-        from_env(TestData, {})
-    with pytest.raises(InvalidVariableFormat):
-        from_env(TestData, {"BOOL_VALUE": "invalid"})
+    assert from_env(TestData, {"NESTED": "[1, 2]"}) == TestData([1, 2])
 
 
 def test_custom_format():
     @dataclass
     class TestData:
-        json_value: List | Dict = field(metadata={"fromenv": Metadata(load=json.loads)})
+        json_value: List | Dict = field(metadata=_JSON_METADATA)
 
     assert from_env(TestData, {"JSON_VALUE": '[1,2,{"hello":"world"}]'}).json_value == [1, 2, {"hello": "world"}]
     with pytest.raises(MissingRequiredVar):
@@ -88,13 +200,26 @@ def test_custom_var_name_short():
 def test_custom_var_name_via_metadata():
     @dataclass
     class TestData:
-        field_name: str = field(metadata={"fromenv": Metadata(name="OVERRIDE_NAME")})
+        field_name: str = field(metadata=_OVERRIDE_NAME_METADATA)
 
     assert from_env(TestData, {"OVERRIDE_NAME": "specified"}).field_name == "specified"
     with pytest.raises(MissingRequiredVar):
         from_env(TestData, {"FIELD_NAME": "anything"})
 
 
+def test_custom_var_name_nested():
+    @dataclass
+    class Nested:
+        value: str = field(metadata={"fromenv": "OVERRIDE_NAME"})
+
+    @dataclass
+    class TestData:
+        nested: Nested | None
+
+    assert from_env(TestData, {"OVERRIDE_NAME": "specified"}).nested == Nested("specified")
+    assert from_env(TestData, {"NESTED_VALUE": "anything"}).nested is None
+
+
 def test_prefix():
     @dataclass
     class TestData:
@@ -118,16 +243,21 @@ def test_custom_separator():
         list: List[int]
 
     config = Config(sep="__")
-    env = {
-        "NESTED__VALUE": "specified",
-        "LIST__0": "1",
-        "LIST__1": "2",
-    }
-    assert from_env(TestData, env, config) == TestData(Nested("specified"), [1, 2])
+    assert from_env(TestData, _CUSTOM_SEPARATOR_ENV, config) == TestData(Nested("specified"), [1, 2])
     with pytest.raises(MissingRequiredVar):
         from_env(TestData, {"NESTED_VALUE": "whatever"}, config)
 
 
+def test_os_environ(monkeypatch):
+    @dataclass
+    class TestData:
+        value: str | None
+
+    monkeypatch.setenv("VALUE", "from-os-environ")
+    assert from_env(TestData).value == "from-os-environ"
+    assert from_env(TestData, {}).value is None
+
+
 def test_nested():
     @dataclass
     class Nested:
@@ -206,15 +336,32 @@ def test_union():
     assert data.union_field == 10
 
 
-def test_list():
+def test_union_order():
     @dataclass
-    class ItemType:
-        required: int
-        optional: str = "default"
+    class First:
+        optional: Union[int, str, None]
+        tuple: tuple[int | str, ...]
 
+    @dataclass
+    class Second:
+        optional: Union[str, int, None]
+        tuple: tuple[str | int, ...]
+
+    env = {"OPTIONAL": "10", "TUPLE_0": "10"}
+    assert from_env(First, env) == First(10, (10,))
+    assert from_env(Second, env) == Second("10", ("10",))
+
+
+@dataclass
+class _ItemType:
+    required: int
+    optional: str = "default"
+
+
+def test_list():
     @dataclass
     class TestData:
-        nested_list: List[ItemType]
+        nested_list: List[_ItemType]
         basic_list: list[int]
 
     assert from_env(TestData, {}) == TestData([], [])
@@ -225,20 +372,51 @@ def test_list():
             "NESTED_LIST_1_REQUIRED": "1",
             "NESTED_LIST_1_OPTIONAL": "specified",
         },
-    ).nested_list == [ItemType(0), ItemType(1, "specified")]
+    ).nested_list == [_ItemType(0), _ItemType(1, "specified")]
 
     assert from_env(TestData, {"BASIC_LIST_0": "100", "BASIC_LIST_1": "200"}).basic_list == [100, 200]
 
 
-def test_var_tuple():
+def test_sequence():
     @dataclass
-    class ItemType:
-        required: int
-        optional: str = "default"
+    class TestData:
+        sequence: Sequence[int]
+
+    assert from_env(TestData, {}) == TestData([])
+    assert from_env(TestData, {"SEQUENCE_0": "1", "SEQUENCE_1": "2"}) == TestData([1, 2])
 
+
+def test_untyped_list():
     @dataclass
     class TestData:
-        nested_tuple: Tuple[ItemType, ...]
+        untyped: list
+
+    with pytest.raises(UnsupportedValueType):
+        from_env(TestData, {"UNTYPED_0": "1"})
+
+
+@pytest.mark.parametrize(
+    "value_type",
+    [
+        Annotated[int, {"unhashable": True}],
+        list[Annotated[int, {"unhashable": True}]],
+        tuple[Annotated[int, {"unhashable": True}], ...],
+        tuple[Annotated[int, {"unhashable": True}], int],
+    ],
+)
+def test_unhashable_annotated(value_type):
+    @dataclass
+    class TestData:
+        value: value_type
+
+    with pytest.raises(UnsupportedValueType):
+        from_env(TestData, {"VALUE": "1", "VALUE_0": "1", "VALUE_1": "2"})
+
+
+def test_var_tuple():
+    @dataclass
+    class TestData:
+        nested_tuple: Tuple[_ItemType, ...]
         basic_tuple: tuple[int, ...]
 
     assert from_env(TestData, {}) == TestData((), ())
@@ -249,7 +427,7 @@ def test_var_tuple():
             "NESTED_TUPLE_1_REQUIRED": "1",
             "NESTED_TUPLE_1_OPTIONAL": "specified",
         },
-    ).nested_tuple == (ItemType(0), ItemType(1, "specified"))
+    ).nested_tuple == (_ItemType(0), _ItemType(1, "specified"))
 
     assert from_env(TestData, {"BASIC_TUPLE_0": "100", "BASIC_TUPLE_1": "200"}).basic_tuple == (100, 200)
 
@@ -260,17 +438,7 @@ def test_fixed_tuple():
         first: Tuple[int, str, bool]
         second: tuple[int, str, bool]
 
-    assert from_env(
-        TestData,
-        {
-            "FIRST_0": "100",
-            "FIRST_1": "first-str",
-            "FIRST_2": "false",
-            "SECOND_0": "200",
-            "SECOND_1": "second-str",
-            "SECOND_2": "true",
-        },
-    ) == TestData((100, "first-str", False), (200, "second-str", True))
+    assert from_env(TestData, _FIXED_TUPLE_ENV) == TestData((100, "first-str", False), (200, "second-str", True))
 
 
 def test_incomplete_fixed_tuple_with_default():
@@ -299,17 +467,11 @@ def test_nested_tuples():
     class TestData:
         tuple: Tuple[int, str, Tuple[int, str, Tuple[str, ...]]]
 
-    assert from_env(
-        TestData,
-        {
-            "TUPLE_0": "0",
-            "TUPLE_1": "str-outer",
-            "TUPLE_2_0": "1",
-            "TUPLE_2_1": "str-nested",
-            "TUPLE_2_2_0": "str-deepest-1",
-            "TUPLE_2_2_1": "str-deepest-2",
-        },
-    ).tuple == (0, "str-outer", (1, "str-nested", ("str-deepest-1", "str-deepest-2")))
+    assert from_env(TestData, _NESTED_TUPLES_ENV).tuple == (
+        0,
+        "str-outer",
+        (1, "str-nested", ("str-deepest-1", "str-deepest-2")),
+    )
 
 
 def test_optional():
@@ -341,7 +503,7 @@ def test_metadata_name():
 def test_custom_loader():
     @dataclass
     class TestData:
-        field_name: List[int] = dataclasses.field(metadata={"fromenv": Metadata(load=json.loads)})
+        field_name: List[int] = dataclasses.field(metadata=_JSON_METADATA)
 
     assert from_env(TestData, {"FIELD_NAME": "[1, 2, 3]"}) == TestData([1, 2, 3])
 